@@ -3,15 +3,26 @@
 1. Copy config_secrets.py.template to config_secrets.py and provide your
    OpenWeatherMap API key and WiFi connection details.
 2. Copy config_secrets.py and main.py to your Raspberry Pi Pico
+3. Optionally precompile to bytecode, so the Pico does not have to parse
+   this file (and hold its parse tree on the heap) at every boot:
+       mpy-cross -O3 -march=armv6m main.py -o picojoker.mpy
+   then copy picojoker.mpy instead, with a main.py that only contains
+   `import picojoker`. For custom firmware builds, add it to the frozen
+   manifest instead so the bytecode runs from flash.
 """
 # Openweather never actually worked, so using open-meteo instead
 import ujson
+import os
 import random
+import ssl
+import struct
+import time
 import pimoroni
 import gc
 import network
 import urequests
 import uasyncio
+from machine import Pin
 from picographics import PicoGraphics, DISPLAY_PICO_DISPLAY
 
 SCREEN_CONFIG = {
@@ -37,17 +48,53 @@ WEATHER_CONFIG = {
     "url_template": "https://api.open-meteo.com/v1/forecast?latitude={lat}&longitude={lon}&current={current}&hourly={hourly}&daily={daily}&timezone={timezone}&forecast_days={forecast_days}",
 }
 
+WMO_WEATHER_CODES = {
+    0: "Clear",
+    1: "Partly Cloudy",
+    2: "Cloudy",
+    3: "Overcast",
+    45: "Fog",
+    48: "Fog+",
+    51: "Light Showers",
+    53: "Showers",
+    55: "Heavy Showers",
+    56: "Freezing drizzle",
+    57: "Freezing drizzle+",
+    61: "Light rain",
+    63: "Rain",
+    65: "Heavy rain",
+    66: "Freezing rain",
+    67: "Freezing rain+",
+    71: "Light snow showers",
+    73: "Snow showers",
+    75: "Heavy snow showers",
+    77: "Sleet showers",
+    80: "Light snow",
+    81: "Snow",
+    83: "Heavy snow",
+    85: "Sleet",
+    86: "Sleet+",
+    95: "Thunderstorm",
+    96: "Thunderstorm hail",
+    99: "Thunderstorm hail+",
+}
+
 LOCAL_JOKE_FILE_EN = "jokes-en.min.json"
 LOCAL_JOKE_FILE_ES = "jokes-es.min.json"
 LOCAL_JOKE_FILE_DE = "jokes-de.min.json"
 
+HTTP_TIMEOUT = 10  # seconds
+HTTP_KEEPALIVE = 5  # seconds an idle connection is kept open
+WEATHER_REQUEST_HEADERS = {"User-Agent": "curl/8.6.0"}
+
 LED_COLOR_IDLE = (0, 0, 10)
 LED_COLOR_BUSY = (10, 5, 0)
 
-BUTTON_A = pimoroni.Button(12)
-BUTTON_B = pimoroni.Button(13)
-BUTTON_X = pimoroni.Button(14)
-BUTTON_Y = pimoroni.Button(15)
+BUTTON_A = Pin(12, Pin.IN, Pin.PULL_UP)
+BUTTON_B = Pin(13, Pin.IN, Pin.PULL_UP)
+BUTTON_X = Pin(14, Pin.IN, Pin.PULL_UP)
+BUTTON_Y = Pin(15, Pin.IN, Pin.PULL_UP)
+BUTTON_DEBOUNCE_MS = 200
 
 # Initialize display
 display = PicoGraphics(display=SCREEN_CONFIG["display"], rotate=SCREEN_CONFIG["rotate"])
@@ -58,26 +105,29 @@ pen_white = display.create_pen(255, 255, 255)
 pen_black = display.create_pen(0, 0, 0)
 pen_red = display.create_pen(255, 0, 0)
 font_scale = SCREEN_CONFIG["font_scale"]
+# Rough number of characters that fit on screen (bitmap6 is ~6x8px per glyph)
+screen_chars = (width // (6 * font_scale)) * (height // (8 * font_scale))
 
 # Initialize LED
 led = pimoroni.RGBLED(*LED_CONFIG["pins_rgb"])
 led.set_rgb(*LED_COLOR_IDLE)
 
 
-def draw_text(x, y, text):
+def draw_text(x, y, text, update=True):
     display.set_pen(pen_white)
     display.text(text, x, y, width, font_scale)
-    display.update()
+    if update:
+        display.update()
 
 
 def clear_screen():
+    # No update here: whatever is drawn next pushes the cleared frame
     display.set_pen(pen_black)
     display.clear()
-    display.update()
 
 
 def log(text):
-    print(f"LOG: {text}")
+    print("LOG:", text)
     display.set_pen(pen_black)
     display.rectangle(0, height - 16, width, 16)
     display.set_pen(pen_white)
@@ -85,6 +135,195 @@ def log(text):
     display.update()
 
 
+class Buttons:
+    """Button presses delivered by pin interrupts, so main() can sleep until
+    one happens instead of polling the pins."""
+
+    def __init__(self, *pins):
+        self.flag = uasyncio.ThreadSafeFlag()
+        self.pressed = None
+        self.last_edge = time.ticks_ms()
+        for pin in pins:
+            pin.irq(self._on_edge, Pin.IRQ_FALLING | Pin.IRQ_RISING)
+
+    def _on_edge(self, pin):
+        # Debounce against the last edge seen on any button, including
+        # releases, so bounce when letting go is not taken as a new press.
+        # Check which edge fired rather than sampling the pin level, which
+        # may catch a bounce and drop the press for good.
+        now = time.ticks_ms()
+        quiet = time.ticks_diff(now, self.last_edge) >= BUTTON_DEBOUNCE_MS
+        self.last_edge = now
+        if quiet and pin.irq().flags() & Pin.IRQ_FALLING:
+            self.pressed = pin
+            self.flag.set()
+
+    async def wait(self):
+        await self.flag.wait()
+        return self.pressed
+
+
+def split_url(url):
+    scheme, _, rest = url.partition("://")
+    host, sep, path = rest.partition("/")
+    tls = scheme == "https"
+    port = 443 if tls else 80
+    if ":" in host:
+        host, port = host.split(":")
+        port = int(port)
+    return host, port, tls, sep + path or "/"
+
+
+# Like urequests, HTTPS runs without certificate verification: there is
+# no CA data on the device. Set explicitly so it does not depend on the
+# firmware's SSLContext defaults.
+tls_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+tls_context.verify_mode = ssl.CERT_NONE
+
+
+class HostConnection:
+    """Keep-alive HTTP/1.1 connection, so back-to-back requests to the same
+    host skip the DNS lookup, TCP connect and TLS handshake. Connections
+    idle for HTTP_KEEPALIVE seconds are closed, since the servers drop them
+    about as quickly and button presses are usually further apart. Runs on
+    uasyncio streams, so other tasks (like the WiFi connect) keep running
+    while waiting on the network."""
+
+    def __init__(self, host, port=443, tls=True):
+        self.host = host
+        self.port = port
+        self.tls = tls
+        self.reader = None
+        self.writer = None
+        self.busy = False
+        self.last_used = 0
+        self.idle_task = None
+
+    async def _connect(self):
+        self.reader, self.writer = await uasyncio.wait_for(
+            uasyncio.open_connection(self.host, self.port, ssl=tls_context if self.tls else None),
+            HTTP_TIMEOUT,
+        )
+
+    async def close(self):
+        # Stream.close() does nothing on uasyncio; the socket and its TLS
+        # context are only released by wait_closed()
+        if self.writer:
+            writer = self.writer
+            self.reader = None
+            self.writer = None
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+    async def _close_when_idle(self):
+        # Frees the socket and TLS buffers instead of keeping a connection
+        # around that the server has most likely closed already
+        try:
+            while self.writer:
+                idle = time.ticks_diff(time.ticks_ms(), self.last_used) / 1000
+                if idle >= HTTP_KEEPALIVE and not self.busy:
+                    await self.close()
+                    break
+                await uasyncio.sleep(max(HTTP_KEEPALIVE - idle, 0.1))
+        finally:
+            self.idle_task = None
+
+    async def get(self, path, headers=None):
+        self.busy = True
+        try:
+            # The server may have dropped an idle connection; retry once on a fresh one
+            for _ in range(2):
+                fresh = not self.writer
+                if fresh:
+                    await self._connect()
+                try:
+                    status, body = await uasyncio.wait_for(self._request(path, headers), HTTP_TIMEOUT)
+                    break
+                except (OSError, EOFError, uasyncio.TimeoutError):
+                    # uasyncio.TimeoutError is not an OSError on MicroPython; a
+                    # silently dropped connection usually shows up as a timeout
+                    await self.close()
+                    if fresh:
+                        raise
+                except Exception:
+                    await self.close()
+                    raise
+        finally:
+            self.busy = False
+            self.last_used = time.ticks_ms()
+            if self.writer and not self.idle_task:
+                self.idle_task = uasyncio.create_task(self._close_when_idle())
+        if status != b"200":
+            raise ValueError(f"HTTP {status.decode()}")
+        return body
+
+    async def _request(self, path, headers):
+        request = f"GET {path} HTTP/1.1\r\nHost: {self.host}\r\nConnection: keep-alive\r\n"
+        if headers:
+            for name, value in headers.items():
+                request += f"{name}: {value}\r\n"
+        self.writer.write((request + "\r\n").encode())
+        await self.writer.drain()
+
+        status = (await self.reader.readline()).split(None, 2)
+        if len(status) < 2:
+            raise OSError("Connection closed")
+        length = None
+        chunked = False
+        close = False
+        while True:
+            line = await self.reader.readline()
+            if not line or line == b"\r\n":
+                break
+            name, _, value = line.partition(b":")
+            name = name.strip().lower()
+            value = value.strip().lower()
+            if name == b"content-length":
+                length = int(value)
+            elif name == b"transfer-encoding":
+                chunked = b"chunked" in value
+            elif name == b"connection":
+                close = value == b"close"
+
+        if chunked:
+            body = await self._read_chunked()
+        elif length is not None:
+            body = await self.reader.readexactly(length)
+        else:
+            body = await self.reader.read(-1)
+            close = True
+        if close:
+            await self.close()
+        return status[1], body
+
+    async def _read_chunked(self):
+        chunks = []
+        while True:
+            size = int((await self.reader.readline()).split(b";")[0], 16)
+            if not size:
+                break
+            chunks.append(await self.reader.readexactly(size))
+            await self.reader.readline()
+        # Skip trailers
+        while (await self.reader.readline()) not in (b"\r\n", b""):
+            pass
+        return b"".join(chunks)
+
+
+_conns = {}
+
+
+async def http_get(host, port, tls, path, headers=None):
+    key = (host, port, tls)
+    conn = _conns.get(key)
+    if conn is None:
+        conn = _conns[key] = HostConnection(host, port, tls)
+    return await conn.get(path, headers)
+
+
 class Echo:
     def __init__(self):
         self.url = "https://echo.free.beeceptor.com"
@@ -95,7 +334,7 @@ class Echo:
         gc.collect()
         led.set_rgb(*LED_COLOR_BUSY)
         try:
-            response = await uasyncio.get_event_loop().create_task(self.fetch_url())
+            response = await self.fetch_url()
             self.response = response.text
         except Exception as e:
             self.error = e
@@ -113,10 +352,21 @@ class Echo:
             draw_text(0, 0, f"Error: {self.error}")
             log(f"Error: {self.error}")
             return
-        draw_text(0, 0, self.response.text if self.response else "No response")
+        # Only draw what fits; text() would otherwise lay out the whole body
+        draw_text(0, 0, self.response[:screen_chars] if self.response else "No response")
 
 
 class BaseJoke:
+    # Common unicode characters mapped to ASCII, like quotes, backticks, accents, etc.
+    _REPLACEMENTS = {
+        "–": "-", "—": "-", "…": "...", "‘": "'", "’": "'", "‚": "'",
+        "“": '"', "„": '"', "`": "'", "´": "'",
+        "á": "a", "à": "a", "â": "a", "ä": "ae", "Ä": "Ae", "ç": "c",
+        "é": "e", "è": "e", "ê": "e", "ë": "e", "í": "i", "î": "i",
+        "ï": "i", "ñ": "n", "ó": "o", "ô": "o", "ö": "oe", "Ö": "Oe",
+        "ß": "ss", "ú": "u", "ù": "u", "û": "u", "ü": "ue", "Ü": "Ue",
+    }
+
     def __init__(self):
         pass
 
@@ -127,18 +377,16 @@ class BaseJoke:
         raise NotImplementedError
 
     def _sanitize(self, text):
-        # Attempt to convert common unicode characters to ASCII, like quotes, backticks, accents, etc.
-        replacements = {
-            "–": "-", "—": "-", "…": "...", "‘": "'", "’": "'", "‚": "'",
-            "“": '"', "„": '"', "`": "'", "´": "'",
-            "á": "a", "à": "a", "â": "a", "ä": "ae", "Ä": "Ae", "ç": "c",
-            "é": "e", "è": "e", "ê": "e", "ë": "e", "í": "i", "î": "i",
-            "ï": "i", "ñ": "n", "ó": "o", "ô": "o", "ö": "oe", "Ö": "Oe",
-            "ß": "ss", "ú": "u", "ù": "u", "û": "u", "ü": "ue", "Ü": "Ue",
-        }
-        for k, v in replacements.items():
-            text = text.replace(k, v)
-        return "".join(i for i in text if ord(i) < 128)
+        # Pure ASCII text (the usual case) is returned as is; max() checks the
+        # code points in C without allocating. Otherwise a single pass over
+        # the text, since MicroPython has no str.translate. Anything
+        # non-ASCII without a replacement is dropped.
+        if "`" not in text and (not text or max(text) < "\x80"):
+            return text
+        table = self._REPLACEMENTS
+        return "".join(
+            table.get(c, c if ord(c) < 128 else "") for c in text
+        )
 
 
 class OnlineGermanPunchlineJoke(BaseJoke):
@@ -146,20 +394,19 @@ class OnlineGermanPunchlineJoke(BaseJoke):
         super().__init__()
         self.joke = None
         self.url = "https://witzapi.de/api/joke"
+        self.host, self.port, self.tls, self.path = split_url(self.url)
         self.error = None
 
     async def fetch_url(self):
-        response = urequests.get(self.url)
-        return response
+        return await http_get(self.host, self.port, self.tls, self.path)
 
     async def fetch(self):
         gc.collect()
         led.set_rgb(*LED_COLOR_BUSY)
         try:
             log(f"Fetching {self.url}")
-            response = await uasyncio.get_event_loop().create_task(self.fetch_url())
-            json_response = ujson.loads(response.text)
-            self.joke = self._sanitize(json_response[0]["text"])
+            body = await self.fetch_url()
+            self.joke = self._sanitize(self._extract_text(body))
         except Exception as e:
             self.error = e
         finally:
@@ -173,28 +420,106 @@ class OnlineGermanPunchlineJoke(BaseJoke):
             return
         draw_text(0, 0, self.joke)
 
+    @staticmethod
+    def _extract_text(body):
+        # The response is always [{"text": "..."}], so find that one string
+        # and only decode it instead of building the list and dict around it
+        i = body.index(b'"', body.index(b'"text":') + 7)
+        j = i + 1
+        while body[j] != 0x22:  # closing "
+            j += 2 if body[j] == 0x5C else 1  # skip escaped characters
+        return ujson.loads(body[i:j + 1])
+
 
 class LocalPunchlineJoke(BaseJoke):
     def __init__(self, filename):
         super().__init__()
-        self.setup = None
-        self.punchline = None
+        self.text = None
         self.filename = filename
+        self.index_filename = filename.replace(".json", ".idx")
+        self.joke_count = self._load_index()
         self.error = None
 
+    def _load_index(self):
+        # Sidecar file starting with the size of the joke file, followed by
+        # the 4-byte little-endian offset of every line. Rebuilt whenever the
+        # joke file size no longer matches. Returns 0 if no index is available.
+        try:
+            size = os.stat(self.filename)[6]
+        except OSError:
+            return 0
+        try:
+            with open(self.index_filename, "rb") as idx:
+                header = idx.read(4)
+            index_size = os.stat(self.index_filename)[6]
+            if len(header) == 4 and struct.unpack("<I", header)[0] == size:
+                return index_size // 4 - 1
+        except OSError:
+            pass
+        log(f"Indexing {self.filename}")
+        # Write to a temporary name first, so a power cut cannot leave a
+        # truncated index that looks valid
+        tmp_filename = self.index_filename + ".tmp"
+        count = 0
+        try:
+            with open(self.filename, "rb") as f, open(tmp_filename, "wb") as idx:
+                idx.write(struct.pack("<I", size))
+                while True:
+                    offset = f.tell()
+                    line = f.readline()
+                    if not line:
+                        break
+                    if line not in (b"\n", b"\r\n"):
+                        idx.write(struct.pack("<I", offset))
+                        count += 1
+            try:
+                os.remove(self.index_filename)
+            except OSError:
+                pass
+            os.rename(tmp_filename, self.index_filename)
+        except OSError:
+            try:
+                os.remove(tmp_filename)
+            except OSError:
+                pass
+            return 0
+        return count
+
+    def _read_indexed_line(self, k):
+        with open(self.index_filename, "rb") as idx:
+            idx.seek(4 + 4 * k)
+            offset = struct.unpack("<I", idx.read(4))[0]
+        with open(self.filename, "rb") as f:
+            f.seek(offset)
+            return f.readline()
+
+    def _sample_line(self):
+        # Reservoir sampling: one pass over the file, one line kept. Lines
+        # stay bytes; only the chosen one is ever parsed.
+        random_joke = None
+        with open(self.filename, "rb") as f:
+            for i, line in enumerate(f, 1):
+                if random.randint(1, i) == 1:
+                    random_joke = line
+        return random_joke
+
     async def fetch(self):
         gc.collect()
         log("Reading local joke...")
         led.set_rgb(*LED_COLOR_BUSY)
         try:
-            with open(self.filename, "r", encoding="utf-8") as f:
-                jokes = [line.strip() for line in f]
-            random_joke = random.choice(jokes)
+            if self.joke_count:
+                random_joke = self._read_indexed_line(random.randrange(self.joke_count))
+            else:
+                random_joke = self._sample_line()
             joke = ujson.loads(random_joke)
-            self.setup = self._sanitize(joke[0])
-            self.punchline = ""
+            setup = self._sanitize(joke[0])
+            punchline = ""
             if len(joke) > 1:
-                self.punchline = self._sanitize(joke[1])
+                punchline = self._sanitize(joke[1])
+            # Built once here so redrawing the joke allocates nothing; the
+            # parsed list and the separate setup/punchline are not kept
+            self.text = setup + "\n---\n" + punchline
         except Exception as e:
             self.error = e
         finally:
@@ -206,7 +531,7 @@ class LocalPunchlineJoke(BaseJoke):
             draw_text(0, 0, f"Error: {self.error}")
             log(f"Error: {self.error}")
             return
-        draw_text(0, 0, self.setup + "\n---\n" + self.punchline)
+        draw_text(0, 0, self.text)
 
 
 class Weather:
@@ -214,21 +539,25 @@ class Weather:
         self.config = config
         self.url_template = config["url_template"]
         self.url = self.url_template.format(**config)
-        self.weather_data = None
-        self.request_headers = {"User-Agent": "curl/8.6.0"}
+        self.host, self.port, self.tls, self.path = split_url(self.url)
+        self.fetch_message = f"Fetching {self.url}"
+        self.time = None
+        self.code = None
+        self.temp = None
+        self.rain_h = None
+        self.rain_p = None
         self.error = None
 
     async def fetch_url(self):
-        log(f"Fetching {self.url}")
-        response = urequests.get(self.url, headers=self.request_headers)
-        return response
+        log(self.fetch_message)
+        return await http_get(self.host, self.port, self.tls, self.path, WEATHER_REQUEST_HEADERS)
     
     async def fetch(self):
         gc.collect()
         led.set_rgb(*LED_COLOR_BUSY)
         try:
-            response = await uasyncio.get_event_loop().create_task(self.fetch_url())
-            self.weather_data = ujson.loads(response.text)
+            body = await self.fetch_url()
+            self._extract(body)
         except Exception as e:
             self.error = e
         finally:
@@ -240,46 +569,46 @@ class Weather:
             draw_text(0, 0, f"Error: {self.error}")
             log(f"Error: {self.error}")
             return
-        draw_text(0, 0, f"{self.weather_data["current"]["time"]}")
-        draw_text(0, 16, self._wmo_weather_code_string(self.weather_data["current"]["weather_code"]))
-        draw_text(0, 32, f"Temp: {self.weather_data["current"]["temperature_2m"]}°C")
-        draw_text(0, 48, f"Rain: {self.weather_data["daily"]["precipitation_hours"][0]}mm")
-        draw_text(0, 64, f"Rain: {self.weather_data["daily"]["precipitation_probability_max"][0]}%")
+        draw_text(0, 0, self.time, update=False)
+        draw_text(0, 16, self._wmo_weather_code_string(self.code), update=False)
+        draw_text(0, 32, f"Temp: {self.temp}°C", update=False)
+        draw_text(0, 48, f"Rain: {self.rain_h}mm", update=False)
+        draw_text(0, 64, f"Rain: {self.rain_p}%", update=False)
         display.update()
 
+    def _extract(self, body):
+        # The response layout is fixed, so pick the few values we show
+        # straight out of the bytes instead of building the whole document
+        # Everything is parsed before any attribute is set, so a malformed
+        # response cannot leave a mix of old and new values
+        current = body.index(b'"current":')
+        daily = body.index(b'"daily":')
+        timestamp = self._field(body, b"time", current)
+        code = self._field(body, b"weather_code", current)
+        code = None if code == "null" else int(code)
+        temp = self._field(body, b"temperature_2m", current)
+        rain_h = self._field(body, b"precipitation_hours", daily)
+        rain_p = self._field(body, b"precipitation_probability_max", daily)
+        self.time = timestamp
+        self.code = code
+        self.temp = temp
+        self.rain_h = rain_h
+        self.rain_p = rain_p
+
+    @staticmethod
+    def _field(body, key, start):
+        # Value of the first "key": after start; for arrays, the first element
+        i = body.index(b'"' + key + b'":', start) + len(key) + 3
+        while body[i] in (0x20, 0x5B):  # space, [
+            i += 1
+        j = i
+        while body[j] not in (0x2C, 0x5D, 0x7D):  # , ] }
+            j += 1
+        return body[i:j].strip().strip(b'"').decode()
+
     @staticmethod
     def _wmo_weather_code_string(code):
-        codes = {
-            0: "Clear",
-            1: "Partly Cloudy",
-            2: "Cloudy",
-            3: "Overcast",
-            45: "Fog",
-            48: "Fog+",
-            51: "Light Showers",
-            53: "Showers",
-            55: "Heavy Showers",
-            56: "Freezing drizzle",
-            57: "Freezing drizzle+",
-            61: "Light rain",
-            63: "Rain",
-            65: "Heavy rain",
-            66: "Freezing rain",
-            67: "Freezing rain+",
-            71: "Light snow showers",
-            73: "Snow showers",
-            75: "Heavy snow showers",
-            77: "Sleet showers",
-            80: "Light snow",
-            81: "Snow",
-            83: "Heavy snow",
-            85: "Sleet",
-            86: "Sleet+",
-            95: "Thunderstorm",
-            96: "Thunderstorm hail",
-            99: "Thunderstorm hail+",
-        }
-        return codes.get(code, f"Unknown weather code ({code})")
+        return WMO_WEATHER_CODES.get(code, f"Unknown weather code ({code})")
 
 
 async def connect_wifi():
@@ -317,33 +646,27 @@ async def main():
     await local_joke_en.fetch()
     local_joke_en.display()
 
-    network_connected = False
-    wifi_task = None
+    buttons = Buttons(BUTTON_A, BUTTON_B, BUTTON_X, BUTTON_Y)
+    wifi_task = uasyncio.get_event_loop().create_task(connect_wifi())
 
     while True:
-        if BUTTON_Y.read():
+        button = await buttons.wait()
+        network_connected = wifi_task.done()
+        if button == BUTTON_Y:
             await local_joke_en.fetch()
             local_joke_en.display()
-        elif BUTTON_X.read() and network_connected:
+        elif button == BUTTON_X and network_connected:
             await local_joke_de.fetch()
             local_joke_de.display()
-        elif BUTTON_A.read() and network_connected:
+        elif button == BUTTON_A and network_connected:
             await weather.fetch()
             weather.display()
-        elif BUTTON_B.read() and network_connected:
+        elif button == BUTTON_B and network_connected:
             # await echo.fetch()
             # echo.display()
             await local_joke_es.fetch()
             local_joke_es.display()
 
-        if not wifi_task:
-            wifi_task = uasyncio.get_event_loop().create_task(connect_wifi())
-
-        if not network_connected and wifi_task.done():
-            network_connected = True
-
-        await uasyncio.sleep(0.2)
-
 
 try:
     uasyncio.run(main())